@@ -13,13 +13,17 @@ from pdschema.columns import Column
 from pdschema.schema import Schema
 from pdschema.validators import Validator
 
+# Patterns are compiled once at import time and shared by all validator instances
+# RFC 5322 compliant email regex
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE_RE = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+
 
 # Example 1: Custom validator for email format
 class IsValidEmail(Validator):
     def __init__(self):
         super().__init__()
-        # RFC 5322 compliant email regex
-        self.email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+        self.email_pattern = _EMAIL_RE
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
@@ -35,8 +39,7 @@ class IsValidPhoneNumber(Validator):
     def __init__(self, format: str = "XXX-XXX-XXXX"):
         super().__init__()
         self.format = format
-        # Convert format to regex pattern
-        self.pattern = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+        self.pattern = _PHONE_RE
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
@@ -52,18 +55,19 @@ class IsStrongPassword(Validator):
     def __init__(self, min_length: int = 8):
         super().__init__()
         self.min_length = min_length
-        self.patterns = {
-            "length": lambda x: len(x) >= min_length,
-            "uppercase": lambda x: any(c.isupper() for c in x),
-            "lowercase": lambda x: any(c.islower() for c in x),
-            "digit": lambda x: any(c.isdigit() for c in x),
-            "special": lambda x: any(not c.isalnum() for c in x),
-        }
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
             return False
-        return all(check(value) for check in self.patterns.values())
+        # str predicates count non-ASCII letters and digits too; any character that
+        # is not alphanumeric is a special character
+        return (
+            len(value) >= self.min_length
+            and any(c.isupper() for c in value)
+            and any(c.islower() for c in value)
+            and any(c.isdigit() for c in value)
+            and not value.isalnum()
+        )
 
     def __str__(self) -> str:
         return (
@@ -9,11 +9,20 @@ import re
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from pdschema.columns import Column
 from pdschema.schema import Schema
 from pdschema.validators import IsNonEmptyString, IsPositive, Validator
 
+# Compiled once here rather than in each validator's __init__
+_WHITESPACE_RE = re.compile(r"\s+")
+_STD_PHONE_RE = re.compile(r"^\(\d{3}\) \d{3}-\d{4}$")
+# Arrow's regex engine reads \s as ASCII whitespace only; this class matches
+# the same characters as \s in Python's re (those for which str.isspace() holds)
+_ARROW_WHITESPACE_PATTERN = r"[\s\x0b\p{Z}\x1c-\x1f\x85]+"
+
 
 # Custom validator for cleaned string
 class IsCleanString(Validator):
@@ -29,7 +38,7 @@ class IsCleanString(Validator):
         if self.strip:
             cleaned = cleaned.strip()
         if self.remove_extra_spaces:
-            cleaned = re.sub(r"\s+", " ", cleaned)
+            cleaned = _WHITESPACE_RE.sub(" ", cleaned)
         return cleaned == value
 
     def __str__(self) -> str:
@@ -46,7 +55,7 @@ class IsStandardizedPhone(Validator):
     def __init__(self, format: str = "(XXX) XXX-XXXX"):
         super().__init__()
         self.format = format
-        self.pattern = re.compile(r"^\(\d{3}\) \d{3}-\d{4}$")
+        self.pattern = _STD_PHONE_RE
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
@@ -57,6 +66,18 @@ class IsStandardizedPhone(Validator):
         return f"must be a standardized phone number in format {self.format}"
 
 
+def clean_whitespace(series: pd.Series, collapse: bool = True) -> pd.Series:
+    """Trim whitespace, and optionally collapse inner runs of it, using PyArrow compute.
+
+    The column is converted to Arrow once and every step runs on Arrow
+    buffers; the result is an Arrow-backed string Series.
+    """
+    arr = pc.utf8_trim_whitespace(pa.array(series, type=pa.string()))
+    if collapse:
+        arr = pc.replace_substring_regex(arr, pattern=_ARROW_WHITESPACE_PATTERN, replacement=" ")
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=series.index, name=series.name)
+
+
 def clean_and_validate_data():
     # Create a sample DataFrame with messy data
     df = pd.DataFrame(
@@ -69,10 +90,13 @@ def clean_and_validate_data():
     )
 
     # Clean the data
-    df["name"] = df["name"].str.strip().str.replace(r"\s+", " ", regex=True)
-    df["phone"] = df["phone"].str.replace(r"[^\d]", "", regex=True).apply(lambda x: f"({x[:3]}) {x[3:6]}-{x[6:]}")
+    df["name"] = clean_whitespace(df["name"])
+    # Split the digits into groups with str.extract and join them with vectorized string
+    # concatenation, rather than formatting each value in a Python function via .apply
+    phone_parts = df["phone"].str.replace(r"[^\d]", "", regex=True).str.extract(r"(\d{3})(\d{3})(\d{4})")
+    df["phone"] = "(" + phone_parts[0] + ") " + phone_parts[1] + "-" + phone_parts[2]
     df["age"] = pd.to_numeric(df["age"].str.strip(), errors="coerce")
-    df["email"] = df["email"].str.strip()
+    df["email"] = clean_whitespace(df["email"], collapse=False)
 
     # Define a schema for cleaned data
     schema = Schema(
@@ -7,6 +7,7 @@ validation scenarios.
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -15,6 +16,16 @@ from pdschema.columns import Column
 from pdschema.schema import Schema
 from pdschema.validators import IsNonEmptyString, IsPositive, Validator
 
+# Captures the amount without the dollar sign
+_CURRENCY_RE = re.compile(r"^\$?(\d+(?:\.\d{2})?)$")
+
+
+@lru_cache(maxsize=None)
+def _sku_re(prefix: str | None) -> re.Pattern:
+    # The lookahead checks the prefix within the same match as the SKU characters
+    lookahead = f"(?={re.escape(prefix)})" if prefix else ""
+    return re.compile(rf"^{lookahead}[A-Z0-9-]+$")
+
 
 # Custom validator for date format
 class IsValidDate(Validator):
@@ -31,6 +42,13 @@ class IsValidDate(Validator):
         except ValueError:
             return False
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series:
+        if not pd.api.types.is_string_dtype(series):
+            # Only strings are valid dates; check mixed columns value by value
+            return super().vectorized_validate(series)
+        # Parses the whole column at once; unparseable values become NaT
+        return pd.to_datetime(series, format=self.format, errors="coerce").notna()
+
     def __str__(self) -> str:
         return f"must be a valid date in format {self.format}"
 
@@ -41,15 +59,15 @@ class IsValidCurrency(Validator):
         super().__init__()
         self.min_amount = min_amount
         self.max_amount = max_amount
-        self.pattern = re.compile(r"^\$?\d+(\.\d{2})?$")
+        self.pattern = _CURRENCY_RE
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
             return False
-        if not self.pattern.match(value):
+        match = self.pattern.match(value)
+        if not match:
             return False
-        # Remove $ and convert to float
-        amount = float(value.replace("$", ""))
+        amount = float(match.group(1))
         if amount < self.min_amount:
             return False
         if self.max_amount is not None and amount > self.max_amount:
@@ -68,16 +86,12 @@ class IsValidSKU(Validator):
     def __init__(self, prefix: str | None = None):
         super().__init__()
         self.prefix = prefix
-        self.pattern = re.compile(r"^[A-Z0-9-]+$")
+        self.pattern = _sku_re(prefix)
 
     def validate(self, value: Any) -> bool:
         if not isinstance(value, str):
             return False
-        if not self.pattern.match(value):
-            return False
-        if self.prefix and not value.startswith(self.prefix):
-            return False
-        return True
+        return bool(self.pattern.match(value))
 
     def __str__(self) -> str:
         msg = "must be a valid SKU (uppercase letters, numbers, and hyphens only"
@@ -1,14 +1,88 @@
-from copy import deepcopy
+import heapq
+import numbers
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 
-from pdschema.types import TYPE_MAPPINGS, infer_pyarrow_type_from_series
+from pdschema.types import DTYPE_TO_PYARROW, LOSSLESS_DTYPES, infer_pyarrow_type_from_series
 from pdschema.validators import Validator
 
 
+def _resolve_validator(validator: Validator | type[Validator] | Callable) -> Validator | type[Validator] | Callable:
+    """Instantiate Validator classes, leaving other validators unchanged.
+
+    A class that cannot be instantiated is returned as-is, so that the error is
+    reported for each validated value as before.
+    """
+    if isinstance(validator, type) and issubclass(validator, Validator):
+        try:
+            return validator()
+        except Exception:
+            pass
+    return validator
+
+
+def _known_null_count(series: pd.Series) -> int | None:
+    """Return the number of nulls in a Series if the dtype tells without a scan, else None."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        # NumPy integer and boolean arrays cannot hold nulls
+        return 0 if dtype.kind in "iub" else None
+    if isinstance(series.array, pd.arrays.ArrowExtensionArray):
+        # Arrow keeps the null count alongside the data
+        return series.array.__arrow_array__().null_count
+    return None
+
+
+def _has_nulls(series: pd.Series) -> bool:
+    """Return whether a Series holds nulls, without scanning it when the dtype tells."""
+    null_count = _known_null_count(series)
+    return bool(_null_mask(series).any()) if null_count is None else null_count > 0
+
+
+def _null_mask(series: pd.Series) -> np.ndarray:
+    """Return a Series' null mask as a NumPy array."""
+    # Asking the backing array skips wrapping the mask in a new Series
+    return np.asarray(series.array.isna())
+
+
+def _drop_nulls(series: pd.Series) -> pd.Series:
+    """Return the non-null values of a Series, or the Series itself if it has none."""
+    if _known_null_count(series) == 0:
+        return series
+    is_null = _null_mask(series)
+    # Avoid the copy made by dropna() when there is nothing to drop
+    return series[~is_null] if is_null.any() else series
+
+
+def _check_n_failure_cases(n_failure_cases) -> None:
+    """Raise ValueError unless ``n_failure_cases`` is None or a non-negative integer."""
+    if n_failure_cases is not None and not (isinstance(n_failure_cases, numbers.Integral) and n_failure_cases >= 0):
+        raise ValueError(f"n_failure_cases must be a non-negative integer or None, got {n_failure_cases!r}")
+
+
+@lru_cache(maxsize=256)
+def _converts_losslessly(dtype, pa_type: pa.DataType) -> bool:
+    """Return whether values of a pandas or PyArrow dtype always convert to a PyArrow type.
+
+    Wide schemas repeat the same few dtypes, so decisions are cached. Callers
+    pass categorical and Arrow-backed dtypes unwrapped, which keeps the cache
+    from holding on to categories.
+    """
+    if isinstance(dtype, pa.DataType) and dtype == pa_type:
+        return True
+    return str(dtype) in LOSSLESS_DTYPES.get(pa_type, ())
+
+
 class Column:
+    # Schemas can hold hundreds of columns; slots avoid a per-instance __dict__
+    __slots__ = ("_dtype", "_pa_type", "_pipeline", "name", "nullable", "validators")
+
     def __init__(
         self,
         name: str | None = None,
@@ -20,20 +94,37 @@ class Column:
         self.dtype = dtype
         self.nullable = nullable
         self.validators = validators or []
+        self._pipeline = None  # Built lazily by _validator_pipeline
+
+    @property
+    def dtype(self) -> type | str:
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype: type | str):
+        self._dtype = dtype
+        # Resolve the pyarrow type once here; None marks an unsupported dtype
+        try:
+            self._pa_type = DTYPE_TO_PYARROW.get(dtype)
+        except TypeError:  # Unhashable dtype
+            self._pa_type = None
 
     def set_name(self, name: str):
         """Set the name of the column dynamically."""
         self.name = name
 
     def with_name(self, name: str):
-        return self.__class__(name, self.dtype, self.nullable, deepcopy(self.validators))
+        """Return a copy of the column with the given name.
 
-    def to_pyarrow_type(self):
-        for mapping in TYPE_MAPPINGS:
-            if self.dtype in mapping:
-                return mapping[self.dtype]
+        Validators are shared with the copy rather than deep-copied, as they are
+        not modified after construction.
+        """
+        return self.__class__(name, self.dtype, self.nullable, list(self.validators))
 
-        raise TypeError(f"Unsupported dtype: {self.dtype}")
+    def to_pyarrow_type(self):
+        if self._pa_type is None:
+            raise TypeError(f"Unsupported dtype: {self.dtype}")
+        return self._pa_type
 
     def infer_pyarrow_type(self, values: pd.Series):
         try:
@@ -48,35 +139,152 @@ class Column:
         except Exception as err:
             raise TypeError("Unsupported dtype") from err
 
-    def validate(self, values: pd.Series) -> list[str]:
+    def validate(self, values: pd.Series, n_failure_cases: int | None = None) -> list[str]:
         """Validate a pandas Series against this column's constraints.
 
+        Validators are applied to the whole column at once through
+        ``Validator.vectorized_validate``. Validators that cannot be vectorized
+        for the given values fall back to validating one value at a time.
+
         Args:
             values: The pandas Series to validate.
+            n_failure_cases: Maximum number of error messages to return. All
+                errors are returned if None.
 
         Returns:
             A list of validation error messages, if any.
+
+        Raises:
+            ValueError: If n_failure_cases is neither None nor a non-negative integer.
         """
+        _check_n_failure_cases(n_failure_cases)
+        return self._validate_non_null(_drop_nulls(values), n_failure_cases)
+
+    def check(self, series: pd.Series, n_failure_cases: int | None = None) -> list[str]:
+        """Run the nullability, type and validator checks on a Series.
+
+        This is equivalent to calling ``check_nullability``, ``check_type`` and
+        ``validate`` in turn, but finds the column's nulls once and shares the
+        non-null values between the checks.
+
+        Args:
+            series: The pandas Series to check.
+            n_failure_cases: Maximum number of validator error messages to
+                return. All errors are returned if None.
+
+        Returns:
+            A list of error messages, if any.
+
+        Raises:
+            ValueError: If n_failure_cases is neither None nor a non-negative integer.
+        """
+        _check_n_failure_cases(n_failure_cases)
         errors = []
-        for i, val in values.items():
-            if pd.isnull(val):
-                continue
-
-            for validator in self.validators:
-                try:
-                    # Check if the validator is callable and apply it directly
-                    if not isinstance(validator, Validator):
-                        validator_instance = validator()
-                    else:
-                        validator_instance = validator
-
-                    if not validator_instance.validate(val):
-                        errors.append(f"Validation failed in '{self.name}' at index {i}: {val}")
-                        break
-                except Exception as e:
-                    errors.append(f"Validator error in '{self.name}' at index {i}: {e}")
+        non_null = _drop_nulls(series)
+
+        if not self.nullable and len(non_null) < len(series):
+            errors.append(self._null_error())
+
+        if type_error := self._check_type(non_null):
+            errors.append(type_error)
+
+        errors.extend(self._validate_non_null(non_null, n_failure_cases))
         return errors
 
+    def _validate_non_null(self, non_null: pd.Series, n_failure_cases: int | None) -> list[str]:
+        if not self.validators:
+            return []
+
+        # Rows that already failed a validator are not checked by later ones
+        failed = np.zeros(len(non_null), dtype=bool)
+        exceptions: list[tuple[int, Exception]] = []
+
+        for validator in self._validator_pipeline():
+            mask = self._vectorized_mask(validator, non_null)
+            if mask is None:
+                exceptions.extend(self._validate_elementwise(validator, non_null, failed, n_failure_cases))
+            elif not mask.all():
+                # Only a validator with failures pays for inverting its mask
+                failed |= ~mask
+
+        # Valid columns are the common case; skip collecting failure positions
+        if not exceptions and not failed.any():
+            return []
+
+        # Report errors in row order. A row's validator errors come before its
+        # validation failure, since no validator runs after a row has failed.
+        exceptions.sort(key=itemgetter(0))
+        errors = heapq.merge(exceptions, ((pos, None) for pos in np.flatnonzero(failed)), key=itemgetter(0))
+        return [self._format_failure(non_null, pos, error) for pos, error in islice(errors, n_failure_cases)]
+
+    def _validator_pipeline(self) -> tuple[Validator | type[Validator] | Callable, ...]:
+        """Return the validators with Validator classes instantiated up front.
+
+        The pipeline is built once and reused until ``validators`` changes, so
+        repeated validations skip resolving each validator again.
+        """
+        validators = tuple(self.validators)
+        if self._pipeline is None or self._pipeline[0] != validators:
+            self._pipeline = (validators, tuple(_resolve_validator(validator) for validator in validators))
+        return self._pipeline[1]
+
+    @staticmethod
+    def _vectorized_mask(validator: Validator | type[Validator] | Callable, values: pd.Series) -> np.ndarray | None:
+        """Return the boolean mask of a validator, or None if it cannot be vectorized."""
+        try:
+            instance = validator if isinstance(validator, Validator) else validator()
+            mask = np.asarray(instance.vectorized_validate(values), dtype=bool)
+        except Exception:
+            return None
+        return mask if mask.shape == (len(values),) else None
+
+    @staticmethod
+    def _validate_elementwise(
+        validator: Validator | type[Validator] | Callable,
+        values: pd.Series,
+        failed: np.ndarray,
+        limit: int | None = None,
+    ) -> list[tuple[int, Exception]]:
+        """Apply a validator one value at a time.
+
+        Failing rows are marked in ``failed``; up to ``limit`` exceptions raised
+        by the validator are returned with their row positions.
+        """
+        if isinstance(validator, Validator):
+            check = validator.validate
+        else:
+            # Classes that could not be instantiated up front, and other
+            # callables, are called per value so that their errors are reported
+            def check(val):
+                return validator().validate(val)
+
+        # tolist() boxes all values in one call, yielding the same Python
+        # scalars as iterating the Series but without its per-item overhead
+        rows = values.tolist()
+        already_failed = failed.tolist()
+        exceptions = []
+        start = 0
+        # The try block wraps the whole loop rather than each row, so valid
+        # rows run without exception-handling setup; after an error the loop
+        # resumes at the row after the one that raised
+        while start < len(rows):
+            try:
+                for pos in range(start, len(rows)):
+                    if not already_failed[pos] and not check(rows[pos]):
+                        failed[pos] = True
+                break
+            except Exception as e:
+                if limit is None or len(exceptions) < limit:
+                    exceptions.append((pos, e))
+                start = pos + 1
+        return exceptions
+
+    def _format_failure(self, values: pd.Series, pos: int, error: Exception | None) -> str:
+        index = values.index[pos]
+        if error is None:
+            return f"Validation failed in '{self.name}' at index {index}: {values.iloc[pos]}"
+        return f"Validator error in '{self.name}' at index {index}: {error}"
+
     def check_missing(self, df: pd.DataFrame) -> str | None:
         """Check if the column is missing in the DataFrame.
 
@@ -97,10 +305,13 @@ class Column:
         Returns:
             An error message if nullability constraints are violated, otherwise None.
         """
-        if not self.nullable and series.isnull().any():
-            return f"Null values found in non-nullable column: {self.name}"
+        if not self.nullable and _has_nulls(series):
+            return self._null_error()
         return None
 
+    def _null_error(self) -> str:
+        return f"Null values found in non-nullable column: {self.name}"
+
     def check_type(self, series: pd.Series) -> str | None:
         """Check if the column's data type matches the expected type.
 
@@ -110,8 +321,29 @@ class Column:
         Returns:
             An error message if the data type does not match, otherwise None.
         """
+        # Only look for nulls to drop when the dtype alone does not settle the type
+        if self._has_lossless_dtype(series):
+            return None
+        return self._check_type(_drop_nulls(series))
+
+    def _has_lossless_dtype(self, series: pd.Series) -> bool:
+        """Return whether the Series dtype alone guarantees conversion to the column's type."""
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Every value is one of the categories, so their dtype decides
+            dtype = dtype.categories.dtype
+        if isinstance(dtype, pd.ArrowDtype):
+            # Arrow-backed columns carry their Arrow type, so compare it directly
+            # instead of copying the data into a new Arrow array
+            dtype = dtype.pyarrow_dtype
+        return _converts_losslessly(dtype, self.to_pyarrow_type())
+
+    def _check_type(self, non_null: pd.Series) -> str | None:
+        if self._has_lossless_dtype(non_null):
+            return None
+
         try:
-            pa.array(series.dropna(), type=self.to_pyarrow_type())
+            pa.array(non_null, type=self._pa_type)
         except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
             return f"Type mismatch in column '{self.name}': {e}"
         return None
@@ -1,3 +1,5 @@
+import inspect
+import os
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -7,15 +9,77 @@ import pandas as pd
 from pdschema.schema import Schema
 
 
+def _resolve_schema(schema_or_type: Schema | type) -> Schema | type:
+    """Instantiate declarative Schema classes, leaving instances and plain types as-is."""
+    if isinstance(schema_or_type, type) and issubclass(schema_or_type, Schema):
+        return schema_or_type()
+    return schema_or_type
+
+
+def _positional_indices(func: Callable) -> dict[str, int]:
+    """Map the names of a function's positional parameters to their positions."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):  # No signature available
+        return {}
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return {param.name: i for i, param in enumerate(parameters) if param.kind in positional}
+
+
+def _make_check(name: str, schema_or_type: Schema | type, kind: str) -> Callable[[Any], None]:
+    """Build the check for one argument or output.
+
+    Whether ``schema_or_type`` is a Schema or a type is decided here, once,
+    rather than on every call of the decorated function.
+
+    Args:
+        name: The argument or output name, used in error messages.
+        schema_or_type: The Schema instance or type to check values against.
+        kind: Either "Argument" or "Output", used in error messages.
+
+    Returns:
+        A function that raises if a value does not match ``schema_or_type``.
+    """
+    if isinstance(schema_or_type, Schema):
+
+        def check(value: Any):
+            if not isinstance(value, pd.DataFrame):
+                raise TypeError(f"{kind} '{name}' must be a pandas DataFrame")
+            schema_or_type.validate(value)
+
+    elif isinstance(schema_or_type, type):
+
+        def check(value: Any):
+            if not isinstance(value, schema_or_type):
+                raise TypeError(f"{kind} '{name}' must be of type {schema_or_type}")
+
+    else:
+
+        def check(value: Any):
+            # An invalid spec is reported when the function is called, as before
+            raise TypeError(f"{kind} schema for '{name}' must be a Schema or type")
+
+    return check
+
+
+def _validation_disabled() -> bool:
+    """Return whether validation is turned off through the PDSCHEMA_DISABLE environment variable."""
+    return os.environ.get("PDSCHEMA_DISABLE", "").strip().lower() in ("1", "true", "yes")
+
+
 def pdfunction(
     arguments: dict[str, Schema | type] | None = None,
     outputs: dict[str, Schema | type] | None = None,
+    enabled: bool = True,
 ) -> Callable:
     """Decorator for validating pandas function inputs and outputs against schemas.
 
     Args:
         arguments: Dictionary mapping argument names to their expected schemas or types
         outputs: Dictionary mapping output names to their expected schemas
+        enabled: Whether to validate at all. When False, or when the
+            ``PDSCHEMA_DISABLE`` environment variable is set to ``1`` at
+            decoration time, the function is returned undecorated.
 
     Returns:
         Callable: Decorated function with schema validation
@@ -35,45 +99,45 @@ def pdfunction(
             # Function implementation
             return {"result": result_df}
     """
-    arguments = arguments or {}
-    outputs = outputs or {}
+    if not enabled or _validation_disabled():
+        return lambda func: func
+
+    # Schema classes are instantiated once here rather than on every call
+    arguments = {name: _resolve_schema(schema) for name, schema in (arguments or {}).items()}
+    outputs = {name: _resolve_schema(schema) for name, schema in (outputs or {}).items()}
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def _validate_schema_or_type(
-            name: str,
-            value: Any,
-            schema_or_type: Schema | type,
-            is_output: bool = False,
-        ):
-            kind = "Output" if is_output else "Argument"
-            if isinstance(schema_or_type, Schema) or issubclass(schema_or_type, Schema):
-                if not isinstance(value, pd.DataFrame):
-                    raise TypeError(f"{kind} '{name}' must be a pandas DataFrame")
-                # If schema_or_type is a class, instantiate it
-                schema_instance = schema_or_type() if isinstance(schema_or_type, type) else schema_or_type
-                schema_instance.validate(value)
-            elif isinstance(schema_or_type, type):
-                if not isinstance(value, schema_or_type):
-                    raise TypeError(f"{kind} '{name}' must be of type {schema_or_type}")
-            else:
-                raise TypeError(f"{kind} schema for '{name}' must be a Schema or type")
+        # Resolve where each validated argument sits among the positional
+        # arguments once, so calls can look it up by index
+        positions = _positional_indices(func)
+        validated_arguments = [
+            (name, positions.get(name), _make_check(name, schema, "Argument")) for name, schema in arguments.items()
+        ]
+        output_checks = [(name, _make_check(name, schema, "Output")) for name, schema in outputs.items()]
 
+        @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Validate input arguments
-            for arg_name, schema_or_type in arguments.items():
-                if arg_name in kwargs:
-                    _validate_schema_or_type(arg_name, kwargs[arg_name], schema_or_type, is_output=False)
+            # Validate input arguments, whether passed by position or keyword
+            for arg_name, position, check in validated_arguments:
+                if position is not None and position < len(args):
+                    value = args[position]
+                elif arg_name in kwargs:
+                    value = kwargs[arg_name]
+                else:
+                    continue
+                check(value)
 
             # Call the function
             result = func(*args, **kwargs)
 
             # Validate outputs if result is a dictionary
             if isinstance(result, dict):
-                for output_name, output_schema in outputs.items():
-                    if output_name not in result:
-                        raise ValueError(f"Missing output: {output_name}")
-                    _validate_schema_or_type(output_name, result[output_name], output_schema, is_output=True)
+                # Find missing outputs with one set difference before validating any
+                if missing := outputs.keys() - result.keys():
+                    first_missing = next(name for name, _ in output_checks if name in missing)
+                    raise ValueError(f"Missing output: {first_missing}")
+                for output_name, check in output_checks:
+                    check(result[output_name])
 
             return result
 
@@ -1,9 +1,33 @@
+import numbers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import ClassVar, Optional
 
 import pandas as pd
 
-from pdschema.columns import Column
+from pdschema.columns import Column, _check_n_failure_cases, _has_nulls
+
+# Checks applied to dtypes alone, in order, by Schema._infer_column_type
+_DTYPE_TYPE_CHECKS = (
+    (pd.api.types.is_integer_dtype, int),
+    (pd.api.types.is_float_dtype, float),
+    (pd.api.types.is_bool_dtype, bool),
+    (pd.api.types.is_string_dtype, str),
+    (pd.api.types.is_datetime64_dtype, datetime),
+)
+
+
+@lru_cache(maxsize=128)
+def _python_type_from_dtype(dtype) -> type | None:
+    """Return the Python type for a non-object dtype, or None if the dtype alone does not tell.
+
+    Columns of the same dtype are common in wide frames, so results are cached.
+    """
+    for check, inferred_type in _DTYPE_TYPE_CHECKS:
+        if check(dtype):
+            return inferred_type
+    return None
 
 
 class SchemaMeta(type):
@@ -22,6 +46,9 @@ class SchemaMeta(type):
 
 class Schema(metaclass=SchemaMeta):
     _declared_columns: ClassVar[dict[str, Column]] = {}
+    # Set on instances by __repr__; the class default also covers subclasses
+    # whose __init__ does not call Schema.__init__
+    _repr_cache: Optional[tuple] = None
 
     def __init__(self, columns: Optional[list[Column]] = None):
         if not columns and not self._declared_columns:
@@ -40,6 +67,12 @@ class Schema(metaclass=SchemaMeta):
         Returns:
             str: A formatted string showing the schema's columns and their properties
         """
+        # Columns can still be changed in place, so the cached text is only
+        # reused while the fields it shows are unchanged
+        key = tuple((col.name, col.dtype, col.nullable, tuple(col.validators)) for col in self.columns.values())
+        if self._repr_cache is not None and self._repr_cache[0] == key:
+            return self._repr_cache[1]
+
         lines = ["Schema("]
         for col in self.columns.values():
             nullable_str = "nullable=True" if col.nullable else "nullable=False"
@@ -47,51 +80,89 @@ class Schema(metaclass=SchemaMeta):
             dtype_str = col.dtype.__name__ if isinstance(col.dtype, type) else col.dtype
             lines.append(f"    Column(name='{col.name}', dtype={dtype_str}, {nullable_str}{validators_str})")
         lines.append(")")
-        return "\n".join(lines)
+        text = "\n".join(lines)
+        self._repr_cache = (key, text)
+        return text
 
-    def validate(self, df: pd.DataFrame) -> bool:
-        errors = []
+    def validate(self, df: pd.DataFrame, n_failure_cases: int | None = None, max_workers: int | None = None) -> bool:
+        """Validate a pandas DataFrame against the schema.
 
-        for col_name, col in self.columns.items():
-            if not col_name:
-                raise ValueError("Column name cannot be None")
-
-            # Call the check_missing method of the Column class
-            if missing := col.check_missing(df):
-                errors.append(missing)
-                continue
+        Args:
+            df: The pandas DataFrame to validate.
+            n_failure_cases: Maximum number of failing values reported per column.
+                Capping this bounds the size of the error message on large
+                frames. All failures are reported if None.
+            max_workers: Number of threads used to check columns concurrently.
+                Columns are checked one after another if None or 1. Only worth
+                enabling for wide, long frames on several cores, and only with
+                validators that are safe to call from several threads.
 
-            series = df[col_name]
+        Returns:
+            bool: True if the DataFrame is valid.
 
-            # Call the check_nullability method of the Column class
-            if nullability := col.check_nullability(series):
-                errors.append(nullability)
+        Raises:
+            ValueError: If the DataFrame does not match the schema, if
+                n_failure_cases is neither None nor a non-negative integer, or
+                if max_workers is neither None nor a positive integer.
+        """
+        _check_n_failure_cases(n_failure_cases)
+        if max_workers is not None and (
+            isinstance(max_workers, bool) or not isinstance(max_workers, numbers.Integral) or max_workers < 1
+        ):
+            raise ValueError(f"max_workers must be a positive integer or None, got {max_workers!r}")
+
+        # A snapshot, so both loops below see the same columns
+        column_items = tuple(self.columns.items())
+        for col_name, _ in column_items:
+            if not col_name:
+                raise ValueError("Column name cannot be None")
 
-            # Call the check_type method of the Column class
-            if type_error := col.check_type(series):
-                errors.append(type_error)
+        if max_workers is not None and max_workers > 1:
+            # Vectorized checks spend most of their time in NumPy and Arrow
+            # kernels that release the GIL, so columns can be checked in threads
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda item: self._check_column(df, *item, n_failure_cases), column_items))
+        else:
+            results = [self._check_column(df, col_name, col, n_failure_cases) for col_name, col in column_items]
 
-            errors.extend(col.validate(series))
+        # Errors are reported in column order either way
+        errors = [error for column_errors in results for error in column_errors]
 
         if errors:
             raise ValueError("Schema validation failed:\n" + "\n".join(errors))
 
         return True
 
+    @staticmethod
+    def _check_column(df: pd.DataFrame, col_name: str, col: Column, n_failure_cases: int | None) -> list[str]:
+        """Return the errors for one schema column of a DataFrame."""
+        # Call the check_missing method of the Column class
+        if missing := col.check_missing(df):
+            return [missing]
+        # Nullability, type and validator checks in one pass over the column
+        return col.check(df[col_name], n_failure_cases)
+
     @staticmethod
     def _infer_column_type(series: pd.Series) -> type:
         """Infer the Python type for a pandas Series."""
         if series.empty:
             return object
 
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Every value is one of the categories, so their dtype decides. The
+            # categorical dtype itself is never cached, as it holds the categories.
+            dtype = dtype.categories.dtype
+        if not pd.api.types.is_object_dtype(dtype) and (inferred := _python_type_from_dtype(dtype)) is not None:
+            return inferred
+
+        # On a Series rather than its dtype, the dtype checks also inspect
+        # object values, e.g. telling string columns apart
         type_checks = [
-            (pd.api.types.is_integer_dtype, int),
-            (pd.api.types.is_float_dtype, float),
-            (pd.api.types.is_bool_dtype, bool),
-            (pd.api.types.is_string_dtype, str),
-            (pd.api.types.is_datetime64_dtype, datetime),
+            *_DTYPE_TYPE_CHECKS,
             (lambda dtype: hasattr(dtype, "categories"), str),
-            (lambda series: series.apply(lambda x: isinstance(x, dict)).any(), dict),
+            # Only object columns can hold dicts; stop scanning at the first one
+            (lambda series: series.dtype == object and any(isinstance(x, dict) for x in series.to_numpy()), dict),
         ]
 
         for check, inferred_type in type_checks:
@@ -118,9 +189,9 @@ class Schema(metaclass=SchemaMeta):
         columns = [
             Column(
                 name=col_name,
-                dtype=Schema._infer_column_type(df[col_name]),
-                nullable=bool(df[col_name].isnull().any()),
+                dtype=Schema._infer_column_type(series),
+                nullable=_has_nulls(series),
             )
-            for col_name in df.columns
+            for col_name, series in df.items()
         ]
         return Schema(columns)
@@ -1,45 +1,67 @@
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 
-pyarrow__python = {
-    int: pa.int64(),
-    float: pa.float64(),
-    str: pa.string(),
-    bool: pa.bool_(),
-    datetime: pa.timestamp("us"),
-    date: pa.date32(),
-    time: pa.time64("us"),
-    Decimal: pa.decimal128(38, 18),
-    list: pa.list_(pa.null()),
-}
+pyarrow__python = MappingProxyType(
+    {
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        bool: pa.bool_(),
+        datetime: pa.timestamp("us"),
+        date: pa.date32(),
+        time: pa.time64("us"),
+        Decimal: pa.decimal128(38, 18),
+        list: pa.list_(pa.null()),
+    }
+)
 
-pyarrow__pandas = {
-    pd.Int64Dtype(): pa.int64(),
-    pd.Int32Dtype(): pa.int32(),
-    pd.Int16Dtype(): pa.int16(),
-    pd.Int8Dtype(): pa.int8(),
-    pd.UInt64Dtype(): pa.uint64(),
-    pd.UInt32Dtype(): pa.uint32(),
-    pd.UInt16Dtype(): pa.uint16(),
-    pd.UInt8Dtype(): pa.uint8(),
-    pd.Float64Dtype(): pa.float64(),
-    pd.Float32Dtype(): pa.float32(),
-    pd.StringDtype(): pa.string(),
-    pd.BooleanDtype(): pa.bool_(),
-    pd.DatetimeTZDtype(tz="UTC"): pa.timestamp("us", tz="UTC"),
-    pd.CategoricalDtype(): pa.dictionary(pa.int32(), pa.string()),
-    pd.IntervalDtype(): pa.struct([("start", pa.float64()), ("end", pa.float64())]),
-}
+pyarrow__pandas = MappingProxyType(
+    {
+        pd.Int64Dtype(): pa.int64(),
+        pd.Int32Dtype(): pa.int32(),
+        pd.Int16Dtype(): pa.int16(),
+        pd.Int8Dtype(): pa.int8(),
+        pd.UInt64Dtype(): pa.uint64(),
+        pd.UInt32Dtype(): pa.uint32(),
+        pd.UInt16Dtype(): pa.uint16(),
+        pd.UInt8Dtype(): pa.uint8(),
+        pd.Float64Dtype(): pa.float64(),
+        pd.Float32Dtype(): pa.float32(),
+        pd.StringDtype(): pa.string(),
+        pd.BooleanDtype(): pa.bool_(),
+        pd.DatetimeTZDtype(tz="UTC"): pa.timestamp("us", tz="UTC"),
+        pd.CategoricalDtype(): pa.dictionary(pa.int32(), pa.string()),
+        pd.IntervalDtype(): pa.struct([("start", pa.float64()), ("end", pa.float64())]),
+    }
+)
 
 TYPE_MAPPINGS = [
     pyarrow__pandas,
     pyarrow__python,
 ]
 
+# TYPE_MAPPINGS flattened into one dict, earlier mappings taking precedence
+DTYPE_TO_PYARROW = MappingProxyType(
+    {dtype: pa_type for mapping in reversed(TYPE_MAPPINGS) for dtype, pa_type in mapping.items()}
+)
+
+# Pandas dtypes (by name) whose values always convert to the given PyArrow type
+LOSSLESS_DTYPES = {
+    pa.int64(): frozenset(
+        {"int8", "int16", "int32", "int64", "uint8", "uint16", "uint32"}
+        | {"Int8", "Int16", "Int32", "Int64", "UInt8", "UInt16", "UInt32"}
+    ),
+    pa.float64(): frozenset({"float16", "float32", "float64", "Float32", "Float64"}),
+    pa.bool_(): frozenset({"bool", "boolean"}),
+    pa.string(): frozenset({"str", "string"}),
+}
+
 _PANDAS_TO_PA = {
     "int64": pa.int64(),
     "Int64": pa.int64(),
@@ -107,8 +129,33 @@ def _infer_object_type(value):
     raise TypeError(f"Unsupported type: {type(value)}")
 
 
+# Kinds reported by pandas' infer_dtype that settle the PyArrow type on their own.
+# "boolean" is left to the scan below: it maps Python bools to int64 (bool is
+# a subclass of int) but NumPy bools to bool, and infer_dtype does not tell
+# the two apart.
+_INFERRED_KIND_TO_PA = {
+    "string": pa.string(),
+    "integer": pa.int64(),
+    "floating": pa.float64(),
+}
+
+# Kinds that infer_dtype only reports for values of several types. Plain
+# "mixed" is not among them, as it also covers lists or dicts of one type.
+_MIXED_KINDS = frozenset({"mixed-integer", "mixed-integer-float"})
+
+
 def _infer_object_series_type(s: pd.Series) -> pa.DataType:
     """Infer PyArrow type from a pandas Series with object dtype."""
+    # infer_dtype scans the values in C; the Python-level scan below is only
+    # needed for the kinds it does not settle
+    kind = pd.api.types.infer_dtype(s, skipna=True)
+    if kind == "empty":
+        return pa.null()
+    if kind in _INFERRED_KIND_TO_PA:
+        return _INFERRED_KIND_TO_PA[kind]
+    if kind in _MIXED_KINDS:
+        raise TypeError("Cannot infer type from mixed-type object Series")
+
     non_null_values = s.dropna()
     if non_null_values.empty:
         return pa.null()
@@ -122,16 +169,35 @@ def _infer_object_series_type(s: pd.Series) -> pa.DataType:
     return _infer_object_type(non_null_values.iloc[0])
 
 
+@lru_cache(maxsize=128)
+def _infer_dtype_type(dtype) -> pa.DataType:
+    """Infer PyArrow type from a non-object pandas dtype.
+
+    The result depends only on the dtype, so it is cached across Series.
+    """
+    dtype_name = str(dtype)
+    if dtype_name in _PANDAS_TO_PA:
+        return _PANDAS_TO_PA[dtype_name]
+    for predicate, pa_type in _PANDAS_TYPE_PREDICATES:
+        if predicate(dtype):
+            return pa_type
+    raise TypeError(f"Unsupported dtype: {dtype}")
+
+
 def infer_pyarrow_type_from_series(s: pd.Series) -> pa.DataType:
     """Infer PyArrow type from a pandas Series."""
-    if s.empty or s.isna().all():
+    if s.empty:
         return pa.null()
     if s.dtype == "object":
+        # Returns the null type itself when all values are null
         return _infer_object_series_type(s)
-    dtype_name = str(s.dtype)
-    if dtype_name in _PANDAS_TO_PA:
-        return _PANDAS_TO_PA[dtype_name]
-    for predicate, pa_type in _PANDAS_TYPE_PREDICATES:
-        if predicate(s.dtype):
-            return pa_type
-    raise TypeError(f"Unsupported dtype: {s.dtype}")
+    # NumPy integer and boolean Series cannot hold nulls; for typed Series the
+    # values matter only to tell an all-null Series apart
+    can_hold_nulls = not (isinstance(s.dtype, np.dtype) and s.dtype.kind in "iub")
+    if can_hold_nulls and s.isna().all():
+        return pa.null()
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Looked up directly rather than through the cache, which would keep
+        # the dtype and all of its categories alive
+        return _PANDAS_TO_PA["category"]
+    return _infer_dtype_type(s.dtype)
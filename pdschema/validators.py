@@ -1,82 +1,242 @@
+import operator
+import re
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Value types whose length the Length validator checks
+_SIZED_TYPES = (str, list, dict, tuple)
+
+
+def _is_scalar_dtype(dtype) -> bool:
+    """Return True for dtypes that can only hold numbers, booleans or datetimes, never strings or sequences."""
+    return (
+        pd.api.types.is_numeric_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+        or pd.api.types.is_timedelta64_dtype(dtype)
+    )
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray | None:
+    """Return the values of a numeric Series as a NumPy array, or None for other dtypes."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype) and not (
+        pa.types.is_integer(dtype.pyarrow_dtype) or pa.types.is_floating(dtype.pyarrow_dtype)
+    ):
+        # Decimals and other Arrow types without a NumPy equivalent would become
+        # object arrays; comparing the Series runs Arrow compute kernels instead
+        return None
+    if pd.api.types.is_numeric_dtype(dtype):
+        return series.to_numpy()
+    return None
+
+
+def _as_bound(bound, values: np.ndarray):
+    """Return a comparison bound in a form that does not upcast ``values``.
+
+    NumPy compares integer arrays with Python ints exactly and in the array's
+    own dtype, whereas a wider NumPy integer (say int64 against int32 data)
+    first converts the whole array.
+    """
+    if isinstance(bound, np.integer) and values.dtype.kind in "iu":
+        return bound.item()
+    return bound
+
+
+def _compare(series: pd.Series, op, other) -> pd.Series | np.ndarray:
+    """Compare a Series with a value, on the raw NumPy array for numeric dtypes."""
+    values = _numeric_values(series)
+    if values is None:
+        return op(series, other)
+    return op(values, _as_bound(other, values))
+
 
 class Validator(ABC):
+    # Built-in validators declare their fields as slots, keeping instances small
+    # and attribute access in validate() cheap; subclasses without __slots__
+    # still get a regular __dict__
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, value) -> bool:
         pass
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        """Validate all values of a column at once.
+
+        The default implementation applies ``validate`` to each value; subclasses
+        override it with a vectorized implementation where one exists.
+
+        Args:
+            series: The non-null values of the column.
+
+        Returns:
+            A boolean Series or array aligned with ``series``, False where validation fails.
+        """
+        return series.map(self.validate)
+
     def __call__(self, value) -> bool:
         return self.validate(value)
 
 
-class IsPositive(Validator):
+class StatelessValidator(Validator):
+    """Base class for validators that take no parameters.
+
+    Such validators hold no state, so a class that declares ``_instance`` in
+    its own body returns one shared instance from every construction.
+    Subclasses of such a class are constructed normally, since they may add
+    parameters or state of their own.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        if "_instance" not in cls.__dict__:
+            return super().__new__(cls)
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
+class IsPositive(StatelessValidator):
+    __slots__ = ()
+    _instance = None
+
     def validate(self, value) -> bool:
         return value > 0
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.gt, 0)
+
+
+class IsNonEmptyString(StatelessValidator):
+    __slots__ = ()
+    _instance = None
 
-class IsNonEmptyString(Validator):
     def validate(self, value) -> bool:
         return isinstance(value, str) and len(value.strip()) > 0
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        if _is_scalar_dtype(series.dtype):
+            # Decided by the dtype alone, without looking at the values
+            return np.zeros(len(series), dtype=bool)
+        # Whitespace-only strings are what strip() would empty, so test for them
+        # directly rather than building stripped copies. Non-string values yield
+        # NaN for both, which compares as False.
+        return series.str.len().gt(0) & series.str.isspace().eq(False)
+
 
 class Max(Validator):
+    __slots__ = ("max_value",)
+
     def __init__(self, max_value):
         self.max_value = max_value
 
     def validate(self, value) -> bool:
         return value <= self.max_value
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.le, self.max_value)
+
 
 class Min(Validator):
+    __slots__ = ("min_value",)
+
     def __init__(self, min_value):
         self.min_value = min_value
 
     def validate(self, value) -> bool:
         return value >= self.min_value
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.ge, self.min_value)
+
 
 class GreaterThan(Validator):
+    __slots__ = ("threshold",)
+
     def __init__(self, threshold):
         self.threshold = threshold
 
     def validate(self, value) -> bool:
         return value > self.threshold
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.gt, self.threshold)
+
 
 class GreaterThanOrEqual(Validator):
+    __slots__ = ("threshold",)
+
     def __init__(self, threshold):
         self.threshold = threshold
 
     def validate(self, value) -> bool:
         return value >= self.threshold
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.ge, self.threshold)
+
 
 class LessThan(Validator):
+    __slots__ = ("threshold",)
+
     def __init__(self, threshold):
         self.threshold = threshold
 
     def validate(self, value) -> bool:
         return value < self.threshold
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.lt, self.threshold)
+
 
 class LessThanOrEqual(Validator):
+    __slots__ = ("threshold",)
+
     def __init__(self, threshold):
         self.threshold = threshold
 
     def validate(self, value) -> bool:
         return value <= self.threshold
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return _compare(series, operator.le, self.threshold)
+
 
 class Choice(Validator):
+    __slots__ = ("_choice_set", "choices")
+
     def __init__(self, choices: list):
+        if isinstance(choices, str):
+            # A string would be checked for substrings, or for single characters
+            # as a set; neither is likely meant, so ask for a collection instead
+            raise TypeError(f"choices must be a collection of values, not a string: {choices!r}")
         self.choices = choices
+        # Hash lookups make membership O(1); choices that cannot be hashed
+        # are scanned as a list instead
+        try:
+            self._choice_set = frozenset(choices)
+        except TypeError:
+            self._choice_set = None
 
     def validate(self, value) -> bool:
+        if self._choice_set is not None:
+            try:
+                return value in self._choice_set
+            except TypeError:  # Unhashable value, such as a list
+                pass
         return value in self.choices
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        return series.isin(self.choices)
+
 
 class Length(Validator):
+    __slots__ = ("max_length", "min_length")
+
     def __init__(self, min_length: int | None = None, max_length: int | None = None):
         if min_length is None and max_length is None:
             raise ValueError(
@@ -86,7 +246,7 @@ class Length(Validator):
         self.max_length = max_length
 
     def validate(self, value) -> bool:
-        if not isinstance(value, str | list | dict | tuple):
+        if not isinstance(value, _SIZED_TYPES):
             return False
 
         length = len(value)
@@ -97,11 +257,66 @@ class Length(Validator):
             return False
         return True
 
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        if _is_scalar_dtype(series.dtype):
+            return np.zeros(len(series), dtype=bool)
+        if series.dtype == object:
+            # Object columns may mix strings with containers and other values;
+            # -1 marks the values that validate() rejects outright
+            lengths = np.fromiter(
+                (len(value) if isinstance(value, _SIZED_TYPES) else -1 for value in series.to_numpy()),
+                dtype=np.int64,
+                count=len(series),
+            )
+        elif pd.api.types.is_string_dtype(series.dtype):
+            lengths = series.str.len().to_numpy()
+        else:
+            return super().vectorized_validate(series)
+
+        # Lengths are never negative, so a lower bound of 0 also rejects the -1 marker
+        mask = lengths >= max(self.min_length or 0, 0)
+        if self.max_length is not None:
+            mask &= lengths <= self.max_length
+        return mask
+
 
 class Range(Validator):
+    __slots__ = ("max_value", "min_value")
+
     def __init__(self, min_value, max_value):
         self.min_value = min_value
         self.max_value = max_value
 
     def validate(self, value) -> bool:
         return self.min_value <= value <= self.max_value
+
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        values = _numeric_values(series)
+        if values is None:
+            return series.between(self.min_value, self.max_value)
+        # Combine in place to avoid allocating a third array
+        mask = values >= _as_bound(self.min_value, values)
+        mask &= values <= _as_bound(self.max_value, values)
+        return mask
+
+
+class Regex(Validator):
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str | re.Pattern):
+        self.pattern = re.compile(pattern)
+
+    def validate(self, value) -> bool:
+        return isinstance(value, str) and self.pattern.match(value) is not None
+
+    def vectorized_validate(self, series: pd.Series) -> pd.Series | np.ndarray:
+        if _is_scalar_dtype(series.dtype):
+            return np.zeros(len(series), dtype=bool)
+        # Matched with Python's re, as in validate(); pandas' string methods may run
+        # another regex engine with different \w, \d and $ semantics
+        match = self.pattern.match
+        return np.fromiter(
+            (isinstance(value, str) and match(value) is not None for value in series.tolist()),
+            dtype=bool,
+            count=len(series),
+        )
@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 
 from pdschema.columns import Column
-from pdschema.validators import IsPositive
+from pdschema.validators import IsPositive, Max
 
 
 def test_column_initialization():
@@ -36,6 +36,11 @@ def test_column_to_pyarrow_type():
     col = Column("active", bool)
     assert str(col.to_pyarrow_type()) == "bool"
 
+    # Test pandas extension dtypes and caching of the resolved type
+    col = Column("count", pd.Int32Dtype())
+    assert str(col.to_pyarrow_type()) == "int32"
+    assert col.to_pyarrow_type() is col.to_pyarrow_type()
+
     # Test unsupported type
     col = Column("data", dict)
     with pytest.raises(TypeError, match="Unsupported dtype"):
@@ -57,3 +62,56 @@ def test_column_infer_pyarrow_type():
     series = pd.Series(["a", "b", "c"])
     with pytest.raises(TypeError, match="Unsupported dtype"):
         col.infer_pyarrow_type(series)
+
+
+def test_column_validator_pipeline():
+    col = Column("age", int, validators=[IsPositive, Max])
+    errors = col.validate(pd.Series([1, -2]))
+    # Max needs a bound, so it fails to instantiate and reports an error per value
+    assert errors[0].startswith("Validator error in 'age' at index 0")
+    assert errors[1] == "Validation failed in 'age' at index 1: -2"
+
+    # The pipeline follows changes to the validators list
+    col.validators = [IsPositive]
+    assert col.validate(pd.Series([1, -2])) == ["Validation failed in 'age' at index 1: -2"]
+
+
+def test_column_check_type():
+    col = Column("age", int)
+    assert col.check_type(pd.Series([1, 2], dtype="int32")) is None
+    assert col.check_type(pd.Series([1, None], dtype="Int64")) is None
+    assert col.check_type(pd.Series([1, 2], dtype=object)) is None
+    assert "Type mismatch in column 'age'" in col.check_type(pd.Series(["a", "b"]))
+    assert "Type mismatch in column 'age'" in col.check_type(pd.Series([1, "2"], dtype=object))
+    assert col.check_type(pd.Series([1, None], dtype="int64[pyarrow]")) is None
+    assert col.check_type(pd.Series([1, 2], dtype="int32[pyarrow]")) is None
+    assert "Type mismatch in column 'age'" in col.check_type(pd.Series([1.5], dtype="double[pyarrow]"))
+
+    col = Column("name", str)
+    assert col.check_type(pd.Series(["a", "b"], dtype="string")) is None
+    assert col.check_type(pd.Series(["a", "b"], dtype="category")) is None
+    assert "Type mismatch in column 'name'" in col.check_type(pd.Series([1, 2], dtype="category"))
+    assert "Type mismatch in column 'name'" in col.check_type(pd.Series([1, 2]))
+
+
+def test_column_check_nullability():
+    col = Column("value", int, nullable=False)
+    assert col.check_nullability(pd.Series([1, 2])) is None
+    assert col.check_nullability(pd.Series([1, None], dtype="Int64")) is not None
+    assert col.check_nullability(pd.Series([1, None], dtype="int64[pyarrow]")) is not None
+    assert col.check_nullability(pd.Series([1, 2], dtype="int64[pyarrow]")) is None
+    assert col.check_nullability(pd.Series([1.0, float("nan")])) == "Null values found in non-nullable column: value"
+    assert Column("value", int).check_nullability(pd.Series([1, None])) is None
+
+
+def test_column_check():
+    col = Column("score", int, nullable=False, validators=[IsPositive()])
+    assert col.check(pd.Series([1, 2])) == []
+    assert col.check(pd.Series([1.0, None, -3.0])) == [
+        "Null values found in non-nullable column: score",
+        "Validation failed in 'score' at index 2: -3.0",
+    ]
+    errors = col.check(pd.Series(["a", None, 5], dtype=object))
+    assert errors[0] == "Null values found in non-nullable column: score"
+    assert errors[1].startswith("Type mismatch in column 'score'")
+    assert errors[2].startswith("Validator error in 'score' at index 0")
@@ -0,0 +1,24 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def _load_example(name):
+    spec = importlib.util.spec_from_file_location(f"examples.{name}", EXAMPLES_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_clean_whitespace_matches_is_clean_string():
+    data_cleaning = _load_example("data_cleaning")
+    whitespace = [chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace()]
+    series = pd.Series([f"{ws}a{ws}{ws}b{ws}" for ws in whitespace])
+
+    cleaned = data_cleaning.clean_whitespace(series)
+    assert cleaned.tolist() == ["a b"] * len(whitespace)
+    assert all(map(data_cleaning.IsCleanString().validate, cleaned.tolist()))
@@ -88,6 +88,21 @@ def test_pdfunction_missing_output():
         process_data(df=df)
 
 
+def test_pdfunction_missing_output_reported_first():
+    @pdfunction(
+        outputs={
+            "first": Schema([Column("value", int, validators=[IsPositive()])]),
+            "second": Schema([Column("value", int)]),
+        },
+    )
+    def process_data():
+        return {"first": pd.DataFrame({"value": [-1]})}
+
+    # No output is validated while one is missing
+    with pytest.raises(ValueError, match="Missing output: second"):
+        process_data()
+
+
 def test_pdfunction_wrong_output_type():
     @pdfunction(
         arguments={
@@ -114,3 +129,40 @@ def test_pdfunction_no_validation():
     result = no_validation(df=df)
     assert isinstance(result["result"], pd.DataFrame)
     assert list(result["result"]["value"]) == [1, 2, 3]
+
+
+def test_pdfunction_positional_arguments():
+    @pdfunction(
+        arguments={
+            "df": Schema([Column("value", int, validators=[IsPositive()])]),
+            "multiplier": int,
+        },
+    )
+    def multiply_values(df, multiplier=2):
+        return df["value"] * multiplier
+
+    df = pd.DataFrame({"value": [1, 2, 3]})
+    assert list(multiply_values(df, 3)) == [3, 6, 9]
+    assert list(multiply_values(df)) == [2, 4, 6]
+
+    with pytest.raises(ValueError, match="Schema validation failed"):
+        multiply_values(pd.DataFrame({"value": [-1, 2, 3]}), 3)
+
+    with pytest.raises(TypeError, match="Argument 'multiplier' must be of type <class 'int'>"):
+        multiply_values(df, "3")
+
+
+def test_pdfunction_disabled(monkeypatch):
+    schema = Schema([Column("value", int, validators=[IsPositive()])])
+
+    def process_data(df):
+        return {"result": df}
+
+    assert pdfunction(arguments={"df": schema}, enabled=False)(process_data) is process_data
+
+    monkeypatch.setenv("PDSCHEMA_DISABLE", "1")
+    assert pdfunction(arguments={"df": schema})(process_data) is process_data
+
+    monkeypatch.setenv("PDSCHEMA_DISABLE", "0")
+    with pytest.raises(ValueError, match="Schema validation failed"):
+        pdfunction(arguments={"df": schema})(process_data)(df=pd.DataFrame({"value": [-1]}))
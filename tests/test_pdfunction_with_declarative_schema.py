@@ -20,6 +20,8 @@ def test_pdfunction_with_declarative_schema():
         result["value"] = result["value"] * 2
         return {"result": result}
 
+    assert process_data.__name__ == "process_data"
+
     # Valid input
     df = pd.DataFrame({"value": [1, 2, 3]})
     result = process_data(df=df)
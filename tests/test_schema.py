@@ -170,6 +170,21 @@ def test_schema_repr():
     assert "Column(name='age'" in actual_repr
     assert "IsPositive" in actual_repr
 
+    # The cached repr follows changes to the columns
+    assert repr(schema) == actual_repr
+    schema.columns["age"].nullable = False
+    assert "Column(name='age', dtype=int, nullable=False" in repr(schema)
+    schema.columns = {"id": Column("id", int)}
+    assert repr(schema) == "Schema(\n    Column(name='id', dtype=int, nullable=True)\n)"
+
+
+def test_schema_repr_subclass_without_super_init():
+    class CustomSchema(Schema):
+        def __init__(self):
+            self.columns = {"id": Column("id", int)}
+
+    assert repr(CustomSchema()) == "Schema(\n    Column(name='id', dtype=int, nullable=True)\n)"
+
 
 def test_infer_column_type():
     # Test integer type
@@ -195,6 +210,7 @@ def test_infer_column_type():
     # Test categorical type
     s_categorical = pd.Series(["a", "b", "c"], dtype="category")
     assert Schema._infer_column_type(s_categorical) is str
+    assert Schema._infer_column_type(pd.Series([1, 2], dtype="category")) is int
 
     # Test unknown type with sample inference
     s_object = pd.Series([{"key": "value"}, {"key": "value2"}])
@@ -203,3 +219,98 @@ def test_infer_column_type():
     # Test empty series
     s_empty = pd.Series([], dtype=object)
     assert Schema._infer_column_type(s_empty) is object
+
+
+def test_schema_validation_n_failure_cases():
+    schema = Schema([Column("age", int, validators=[IsPositive()])])
+    total = 20
+    limit = 3
+    df = pd.DataFrame({"age": [-1] * total})
+
+    with pytest.raises(ValueError) as exc_info:
+        schema.validate(df)
+    assert str(exc_info.value).count("Validation failed in 'age'") == total
+
+    with pytest.raises(ValueError) as exc_info:
+        schema.validate(df, n_failure_cases=limit)
+    assert str(exc_info.value).count("Validation failed in 'age'") == limit
+    assert "at index 2: -1" in str(exc_info.value)
+
+    for invalid in (-1, 1.5):
+        with pytest.raises(ValueError, match="n_failure_cases must be a non-negative integer or None"):
+            schema.validate(df, n_failure_cases=invalid)
+        with pytest.raises(ValueError, match="n_failure_cases must be a non-negative integer or None"):
+            schema.columns["age"].validate(df["age"], n_failure_cases=invalid)
+
+
+def test_schema_validation_multiple_errors():
+    schema = Schema(
+        [
+            Column("id", int, nullable=False),
+            Column("age", int, validators=[IsPositive()]),
+            Column("name", str),
+            Column("email", str),
+        ]
+    )
+    df = pd.DataFrame({"id": [1.0, None], "age": [-1, 2], "name": [1, 2]})
+
+    # Every error is collected into a single exception
+    with pytest.raises(ValueError) as exc_info:
+        schema.validate(df)
+    lines = str(exc_info.value).splitlines()
+    assert lines[:3] == [
+        "Schema validation failed:",
+        "Null values found in non-nullable column: id",
+        "Validation failed in 'age' at index 0: -1",
+    ]
+    assert lines[3].startswith("Type mismatch in column 'name'")
+    assert lines[4:] == ["Missing column: email"]
+
+
+def test_schema_validation_parallel():
+    schema = Schema([Column(f"c{i}", int, validators=[IsPositive()]) for i in range(6)])
+
+    df = pd.DataFrame({f"c{i}": [1, 2] for i in range(5)})
+    assert schema.validate(df.assign(c5=[3, 4]), max_workers=4) is True
+
+    for invalid in (0, -1, 1.5, "2", True):
+        with pytest.raises(ValueError, match="max_workers must be a positive integer or None"):
+            schema.validate(df, max_workers=invalid)
+
+    with pytest.raises(ValueError) as exc_info:
+        schema.validate(df.assign(c0=[-1, 2], c3=[1, -2]), max_workers=4)
+    assert str(exc_info.value).splitlines()[1:] == [
+        "Validation failed in 'c0' at index 0: -1",
+        "Validation failed in 'c3' at index 1: -2",
+        "Missing column: c5",
+    ]
+
+
+def test_schema_validation_object_strings():
+    schema = Schema([Column("name", str, validators=[IsNonEmptyString(), Length(max_length=5)])])
+
+    df = pd.DataFrame({"name": pd.Series(["Alice", None, "Bob"], dtype=object)})
+    assert schema.validate(df) is True
+
+    df_invalid = pd.DataFrame({"name": pd.Series(["Alice", " ", "Charlie"], dtype=object)})
+    with pytest.raises(ValueError) as exc_info:
+        schema.validate(df_invalid)
+    assert "Validation failed in 'name' at index 1:  " in str(exc_info.value)
+    assert "Validation failed in 'name' at index 2: Charlie" in str(exc_info.value)
+
+
+def test_schema_columns_mapping():
+    schema = Schema([Column("id", int)])
+    assert schema.validate(pd.DataFrame({"id": [1]})) is True
+
+    # Changes to the columns are reflected in validation
+    schema.columns["age"] = Column("age", int)
+    with pytest.raises(ValueError, match="Missing column: age"):
+        schema.validate(pd.DataFrame({"id": [1]}))
+
+    del schema.columns["age"]
+    assert schema.validate(pd.DataFrame({"id": [1]})) is True
+
+    schema.columns = {"age": Column("age", int)}
+    with pytest.raises(ValueError, match="Missing column: age"):
+        schema.validate(pd.DataFrame({"id": [1]}))
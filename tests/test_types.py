@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -92,3 +93,15 @@ def test_infer_pyarrow_type_from_series(capsys=None):
     # Test with pandas nullable boolean type
     s_nullable_bool = pd.Series([True, None, False], dtype=pd.BooleanDtype())
     assert str(infer_pyarrow_type_from_series(s_nullable_bool)) == "bool"
+
+
+def test_infer_pyarrow_type_from_object_series():
+    assert str(infer_pyarrow_type_from_series(pd.Series(["a", None], dtype=object))) == "string"
+    assert str(infer_pyarrow_type_from_series(pd.Series([1, 2], dtype=object))) == "int64"
+    assert str(infer_pyarrow_type_from_series(pd.Series([[1], [2]], dtype=object))) == "list<item: null>"
+    # Python bools are ints to the type lookup, NumPy bools are not
+    assert str(infer_pyarrow_type_from_series(pd.Series([True, None], dtype=object))) == "int64"
+    assert str(infer_pyarrow_type_from_series(pd.Series([np.True_, None], dtype=object))) == "bool"
+
+    with pytest.raises(TypeError, match="mixed-type"):
+        infer_pyarrow_type_from_series(pd.Series([1, 2.5], dtype=object))
@@ -0,0 +1,200 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pdschema.columns import Column
+from pdschema.validators import (
+    Choice,
+    GreaterThan,
+    GreaterThanOrEqual,
+    IsNonEmptyString,
+    IsPositive,
+    Length,
+    LessThan,
+    LessThanOrEqual,
+    Max,
+    Min,
+    Range,
+    Regex,
+    Validator,
+)
+
+
+def test_vectorized_validate():
+    assert IsPositive().vectorized_validate(pd.Series([1, -2, 0, 3.5])).tolist() == [True, False, False, True]
+    assert IsPositive().vectorized_validate(pd.Series([1, -2], dtype="Int64")).tolist() == [True, False]
+    decimals = pd.Series([Decimal("1.50"), Decimal("-2.00")], dtype=pd.ArrowDtype(pa.decimal128(18, 2)))
+    assert IsPositive().vectorized_validate(decimals).tolist() == [True, False]
+    assert Range(0, 1).vectorized_validate(decimals).tolist() == [False, False]
+    assert Range(0, 10).vectorized_validate(pd.Series([0, 5, 10, 11])).tolist() == [True, True, True, False]
+    assert Range("b", "d").vectorized_validate(pd.Series(["a", "c", "e"])).tolist() == [False, True, False]
+    assert IsNonEmptyString().vectorized_validate(pd.Series(["a", "", "  ", 1], dtype=object)).tolist() == [
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert IsNonEmptyString().vectorized_validate(pd.Series([1, 2])).tolist() == [False, False]
+    assert IsNonEmptyString().vectorized_validate(pd.Series([" a ", "\t\n", ""], dtype="string[pyarrow]")).tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert IsNonEmptyString().vectorized_validate(pd.Series(["a", ""], dtype="category")).tolist() == [True, False]
+
+
+def test_vectorized_choice_and_length():
+    assert Choice(["a", "b"]).vectorized_validate(pd.Series(["a", "c", "b"])).tolist() == [True, False, True]
+    assert Choice([1, 2]).vectorized_validate(pd.Series([1.0, 3.0])).tolist() == [True, False]
+
+    length = Length(min_length=1, max_length=2)
+    assert length.vectorized_validate(pd.Series(["a", "abc", ""])).tolist() == [True, False, False]
+    assert length.vectorized_validate(pd.Series(["ab", "abc"], dtype="string[pyarrow]")).tolist() == [True, False]
+    assert length.vectorized_validate(pd.Series(["a", [1, 2, 3], {1}], dtype=object)).tolist() == [True, False, False]
+    assert length.vectorized_validate(pd.Series([1, 2])).tolist() == [False, False]
+    lists = pd.Series([[1], [], (1, 2), {"a": 1}, 5], dtype=object)
+    assert length.vectorized_validate(lists).tolist() == [True, False, True, True, False]
+    assert Length(max_length=1).vectorized_validate(lists).tolist() == [True, True, False, True, False]
+
+
+def test_choice():
+    validator = Choice(["a", "b", 1])
+    assert validator("a") is True
+    assert validator(1.0) is True
+    assert validator("c") is False
+    assert validator([1]) is False  # Unhashable values are not rejected with an error
+
+    validator = Choice([[1, 2], [3]])  # Unhashable choices
+    assert validator([3]) is True
+    assert validator([4]) is False
+
+    with pytest.raises(TypeError, match="not a string"):
+        Choice("abc")
+    assert Choice(("abc",))("abc") is True
+
+
+def test_vectorized_comparisons():
+    series = pd.Series([1, 5, 10])
+    assert Max(5).vectorized_validate(series).tolist() == [True, True, False]
+    assert Min(5).vectorized_validate(series).tolist() == [False, True, True]
+    assert GreaterThan(5).vectorized_validate(series).tolist() == [False, False, True]
+    assert GreaterThanOrEqual(5).vectorized_validate(series).tolist() == [False, True, True]
+    assert LessThan(5).vectorized_validate(series).tolist() == [True, False, False]
+    assert LessThanOrEqual(5).vectorized_validate(series).tolist() == [True, True, False]
+    assert Max("b").vectorized_validate(pd.Series(["a", "c"])).tolist() == [True, False]
+
+    # NumPy integer bounds are compared exactly, even beyond the column's dtype
+    int8 = pd.Series([1, 100], dtype="int8")
+    assert Range(np.int64(50), np.int64(1000)).vectorized_validate(int8).tolist() == [False, True]
+    assert Min(np.int64(2**40)).vectorized_validate(int8).tolist() == [False, False]
+
+
+def test_vectorized_validate_default():
+    class IsEven(Validator):
+        def validate(self, value) -> bool:
+            return value % 2 == 0
+
+    assert IsEven().vectorized_validate(pd.Series([1, 2, 3, 4])).tolist() == [False, True, False, True]
+
+
+def test_column_validate_falls_back_to_elementwise():
+    col = Column("age", int, validators=[IsPositive()])
+    errors = col.validate(pd.Series(["not a number", 25, -10], dtype=object))
+    assert [error.split(":")[0] for error in errors] == [
+        "Validator error in 'age' at index 0",
+        "Validation failed in 'age' at index 2",
+    ]
+    assert errors[1] == "Validation failed in 'age' at index 2: -10"
+
+    # Validation resumes after each error, including on consecutive and last rows
+    errors = col.validate(pd.Series([-1, "a", "b", 3, "c"], dtype=object))
+    assert [error.split(":")[0] for error in errors] == [
+        "Validation failed in 'age' at index 0",
+        "Validator error in 'age' at index 1",
+        "Validator error in 'age' at index 2",
+        "Validator error in 'age' at index 4",
+    ]
+
+
+def test_column_validate_reports_first_failure_per_row():
+    col = Column("score", float, validators=[IsPositive(), Range(0, 100)])
+    errors = col.validate(pd.Series([-1.0, 50.0, None, 150.0]))
+    assert errors == [
+        "Validation failed in 'score' at index 0: -1.0",
+        "Validation failed in 'score' at index 3: 150.0",
+    ]
+
+
+def test_stateless_validators_are_shared():
+    assert IsPositive() is IsPositive()
+    assert IsNonEmptyString() is IsNonEmptyString()
+    assert IsPositive() is not IsNonEmptyString()
+    assert Range(0, 1) is not Range(0, 1)
+
+
+def test_stateless_validator_subclasses():
+    class MinLen(IsNonEmptyString):
+        def __init__(self, n=3):
+            self.n = n
+
+        def validate(self, value) -> bool:
+            return super().validate(value) and len(value) >= self.n
+
+    a = MinLen(5)
+    b = MinLen()
+    assert a is not b
+    assert (a.n, b.n) == (5, 3)
+    assert a("abcd") is False
+    assert b("abcd") is True
+
+    class Positive(IsPositive):
+        pass
+
+    assert Positive() is not Positive()
+    assert IsPositive() is IsPositive()
+
+
+def test_builtin_validators_use_slots():
+    assert not hasattr(Range(0, 1), "__dict__")
+    assert not hasattr(IsPositive(), "__dict__")
+
+    class IsEven(Validator):
+        def validate(self, value) -> bool:
+            return value % 2 == 0
+
+    validator = IsEven()
+    validator.label = "even"  # Subclasses without __slots__ keep a __dict__
+    assert validator.label == "even"
+
+
+def test_regex():
+    validator = Regex(r"\d{3}-\d{4}")
+    assert validator("555-1234") is True
+    assert validator("555-12") is False
+    assert validator(5551234) is False
+
+    series = pd.Series(["555-1234", "x555-1234", "555-1234x"])
+    assert validator.vectorized_validate(series).tolist() == [True, False, True]
+    assert validator.vectorized_validate(series.astype(object)).tolist() == [True, False, True]
+    assert validator.vectorized_validate(pd.Series([5551234])).tolist() == [False]
+
+
+def test_regex_vectorized_matches_validate():
+    validator = Regex(r"\w+$")
+    values = ["héllo", "١٢٣", "ok\n", "ok\n\n", "", "a b"]
+    expected = [True, True, True, False, False, False]
+    assert [validator(value) for value in values] == expected
+
+    column = Column("a", str, validators=[validator])
+    for dtype in (str, "string[pyarrow]", pd.ArrowDtype(pa.string()), object):
+        series = pd.Series(values, dtype=dtype)
+        assert validator.vectorized_validate(series).tolist() == expected
+        errors = column.validate(series)
+        assert [error.split(":")[0] for error in errors] == [
+            "Validation failed in 'a' at index 3",
+            "Validation failed in 'a' at index 4",
+            "Validation failed in 'a' at index 5",
+        ]